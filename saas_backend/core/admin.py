@@ -5,6 +5,7 @@ from .models import UserProfile, Project, Task
 @admin.register(UserProfile)
 class UserProfileAdmin(admin.ModelAdmin):
     list_display = ['user', 'role', 'department', 'is_active', 'created_at']
+    list_select_related = ['user']
     list_filter = ['role', 'is_active', 'created_at']
     search_fields = ['user__username', 'user__email', 'department']
     readonly_fields = ['created_at', 'updated_at']
@@ -13,6 +14,7 @@ class UserProfileAdmin(admin.ModelAdmin):
 @admin.register(Project)
 class ProjectAdmin(admin.ModelAdmin):
     list_display = ['name', 'owner', 'status', 'start_date', 'end_date', 'created_at']
+    list_select_related = ['owner']
     list_filter = ['status', 'created_at']
     search_fields = ['name', 'description', 'owner__username']
     readonly_fields = ['created_at', 'updated_at']
@@ -22,6 +24,7 @@ class ProjectAdmin(admin.ModelAdmin):
 @admin.register(Task)
 class TaskAdmin(admin.ModelAdmin):
     list_display = ['title', 'project', 'assigned_to', 'priority', 'status', 'due_date']
+    list_select_related = ['project', 'assigned_to']
     list_filter = ['status', 'priority', 'created_at']
     search_fields = ['title', 'description', 'project__name']
     readonly_fields = ['created_at', 'updated_at']
\ No newline at end of file
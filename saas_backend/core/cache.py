@@ -0,0 +1,64 @@
+from django.core.cache import cache
+from django.db import transaction
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Dashboard stats are cached briefly per user and invalidated per tenant
+DASHBOARD_CACHE_TIMEOUT = 30
+
+
+def _dashboard_version_key(schema_name):
+    return f"dashboard_version:{schema_name}"
+
+
+def dashboard_cache_key(schema_name, user_id):
+    """
+    Build the dashboard cache key for a user in a tenant schema.
+    The tenant's version number is part of the key, so bumping it
+    invalidates every cached dashboard in that tenant at once.
+    """
+    version = cache.get_or_set(_dashboard_version_key(schema_name), 1, None)
+    return f"dashboard:{schema_name}:{version}:{user_id}"
+
+
+def get_or_compute_dashboard_stats(schema_name, user_id, compute):
+    """
+    Return a user's cached dashboard stats, calling compute() on a miss.
+    Cache errors are logged and fall back to compute(), so a cache outage
+    only costs the uncached queries.
+    """
+    try:
+        key = dashboard_cache_key(schema_name, user_id)
+        stats = cache.get(key)
+    except Exception as e:
+        logger.warning(f"Could not read dashboard cache for {schema_name}: {str(e)}")
+        return compute()
+
+    if stats is None:
+        stats = compute()
+        try:
+            cache.set(key, stats, DASHBOARD_CACHE_TIMEOUT)
+        except Exception as e:
+            logger.warning(f"Could not write dashboard cache for {schema_name}: {str(e)}")
+
+    return stats
+
+
+def _bump_dashboard_version(schema_name):
+    try:
+        cache.incr(_dashboard_version_key(schema_name))
+    except ValueError:
+        # No version stored yet, so nothing has been cached for this tenant
+        pass
+    except Exception as e:
+        # Stale dashboards expire on their own; never fail the write
+        logger.warning(f"Could not invalidate dashboard cache for {schema_name}: {str(e)}")
+
+
+def invalidate_dashboard_cache(schema_name):
+    """
+    Invalidate all cached dashboards in a tenant schema.
+    Call once per write operation; the bump runs after the transaction commits.
+    """
+    transaction.on_commit(lambda: _bump_dashboard_version(schema_name))
@@ -64,6 +64,9 @@ class Project(models.Model):
         verbose_name = 'Project'
         verbose_name_plural = 'Projects'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['owner', 'status'], name='project_owner_status_idx'),
+        ]
 
     def __str__(self):
         return self.name
@@ -84,6 +87,7 @@ class Task(models.Model):
         ('high', 'High'),
         ('urgent', 'Urgent'),
     ]
+    PRIORITY_DISPLAY = dict(PRIORITY_CHOICES)
 
     STATUS_CHOICES = [
         ('todo', 'To Do'),
@@ -116,6 +120,17 @@ class Task(models.Model):
         verbose_name = 'Task'
         verbose_name_plural = 'Tasks'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['project', 'status'], name='task_project_status_idx'),
+            models.Index(fields=['assigned_to', 'status'], name='task_assignee_status_idx'),
+            models.Index(fields=['status', 'completed_at'], name='task_status_completed_idx'),
+            # Partial index backing the periodic overdue task scan
+            models.Index(
+                fields=['due_date'],
+                condition=models.Q(status__in=['todo', 'in_progress', 'review']),
+                name='task_overdue_idx',
+            ),
+        ]
 
     def __str__(self):
         return f"{self.project.name} - {self.title}"
\ No newline at end of file
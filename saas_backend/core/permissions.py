@@ -1,4 +1,17 @@
 from rest_framework import permissions
+from .models import UserProfile
+
+
+def get_profile_role(user):
+    """
+    Return the user's profile role, or None if there is no profile.
+    The role is cached on the user instance for the rest of the request.
+    """
+    if not hasattr(user, '_profile_role'):
+        user._profile_role = UserProfile.objects.filter(
+            user=user
+        ).values_list('role', flat=True).first()
+    return user._profile_role
 
 
 class IsTenantUser(permissions.BasePermission):
@@ -20,12 +33,12 @@ class IsProjectOwnerOrMember(permissions.BasePermission):
         # Read permissions for members
         if request.method in permissions.SAFE_METHODS:
             return (
-                    obj.owner == request.user or
-                    request.user in obj.members.all()
+                    obj.owner_id == request.user.pk or
+                    obj.members.filter(pk=request.user.pk).exists()
             )
 
         # Write permissions only for owner
-        return obj.owner == request.user
+        return obj.owner_id == request.user.pk
 
 
 class IsTaskProjectMember(permissions.BasePermission):
@@ -36,8 +49,8 @@ class IsTaskProjectMember(permissions.BasePermission):
     def has_object_permission(self, request, view, obj):
         project = obj.project
         return (
-                project.owner == request.user or
-                request.user in project.members.all()
+                project.owner_id == request.user.pk or
+                project.members.filter(pk=request.user.pk).exists()
         )
 
 
@@ -51,15 +64,15 @@ class IsAdminOrOwner(permissions.BasePermission):
 
     def has_object_permission(self, request, view, obj):
         # Admins can do anything
-        if hasattr(request.user, 'profile') and request.user.profile.role == 'admin':
+        if get_profile_role(request.user) == 'admin':
             return True
 
-        # Check if user is the owner
-        if hasattr(obj, 'owner'):
-            return obj.owner == request.user
-        if hasattr(obj, 'created_by'):
-            return obj.created_by == request.user
-        if hasattr(obj, 'user'):
-            return obj.user == request.user
+        # Check if user is the owner, comparing ids to avoid loading the user
+        if hasattr(obj, 'owner_id'):
+            return obj.owner_id == request.user.pk
+        if hasattr(obj, 'created_by_id'):
+            return obj.created_by_id == request.user.pk
+        if hasattr(obj, 'user_id'):
+            return obj.user_id == request.user.pk
 
         return False
\ No newline at end of file
@@ -1,5 +1,7 @@
 from rest_framework import serializers
 from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import Q
 from .models import UserProfile, Project, Task
 
 
@@ -33,32 +35,51 @@ class UserRegistrationSerializer(serializers.Serializer):
     phone = serializers.CharField(max_length=20, required=False)
     department = serializers.CharField(max_length=100, required=False)
 
-    def validate_username(self, value):
-        if User.objects.filter(username=value).exists():
-            raise serializers.ValidationError("Username already exists in this organization.")
-        return value
+    def validate(self, attrs):
+        """Check username and email uniqueness with a single query"""
+        username = attrs['username']
+        email = attrs['email']
+        errors = {}
 
-    def validate_email(self, value):
-        if User.objects.filter(email=value).exists():
-            raise serializers.ValidationError("Email already exists in this organization.")
-        return value
+        existing = User.objects.filter(
+            Q(username=username) | Q(email=email)
+        ).values_list('username', 'email')
+
+        for existing_username, existing_email in existing:
+            if existing_username == username:
+                errors['username'] = "Username already exists in this organization."
+            if existing_email == email:
+                errors['email'] = "Email already exists in this organization."
+
+        if errors:
+            raise serializers.ValidationError(errors)
+        return attrs
 
     def create(self, validated_data):
         # Extract profile data
         role = validated_data.pop('role', 'member')
         phone = validated_data.pop('phone', None)
         department = validated_data.pop('department', None)
-
-        # Create user
-        user = User.objects.create_user(**validated_data)
-
-        # Create profile
-        UserProfile.objects.create(
-            user=user,
-            role=role,
-            phone=phone,
-            department=department
-        )
+        password = validated_data.pop('password')
+
+        with transaction.atomic():
+            # Create user, mirroring User.objects.create_user()
+            user = User(**validated_data)
+            user.username = User.normalize_username(user.username)
+            user.email = User.objects.normalize_email(user.email)
+            user.set_password(password)
+
+            # The profile is created below with the submitted fields
+            user._skip_profile_signal = True
+            user.save()
+
+            # Create profile
+            UserProfile.objects.create(
+                user=user,
+                role=role,
+                phone=phone,
+                department=department
+            )
 
         return user
 
@@ -86,7 +107,11 @@ class ProjectSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'owner', 'created_at', 'updated_at']
 
     def get_task_count(self, obj):
-        return obj.tasks.count()
+        # Prefer the count annotated by the viewset queryset
+        task_count = getattr(obj, 'task_count', None)
+        if task_count is None:
+            return obj.tasks.count()
+        return task_count
 
     def create(self, validated_data):
         # Set owner to current user
@@ -125,7 +150,7 @@ class TaskSerializer(serializers.ModelSerializer):
     def validate_project(self, value):
         """Ensure user can only create tasks in projects they have access to"""
         user = self.context['request'].user
-        if value.owner != user and user not in value.members.all():
+        if value.owner_id != user.pk and not value.members.filter(pk=user.pk).exists():
             raise serializers.ValidationError(
                 "You don't have permission to create tasks in this project."
             )
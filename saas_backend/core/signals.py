@@ -10,20 +10,11 @@ def create_user_profile(sender, instance, created, **kwargs):
     """
     Automatically create a UserProfile when a User is created.
     Only for tenant schemas, not for public schema.
+    Skipped when the caller creates the profile itself.
     """
-    if created:
+    if created and not getattr(instance, '_skip_profile_signal', False):
         # Check if we're in a tenant schema (not public)
         schema_name = connection.schema_name
         if schema_name != 'public':
             UserProfile.objects.get_or_create(user=instance)
 
-
-@receiver(post_save, sender=User)
-def save_user_profile(sender, instance, **kwargs):
-    """
-    Save the UserProfile whenever the User is saved.
-    Only for tenant schemas, not for public schema.
-    """
-    schema_name = connection.schema_name
-    if schema_name != 'public' and hasattr(instance, 'profile'):
-        instance.profile.save()
\ No newline at end of file
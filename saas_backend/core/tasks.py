@@ -1,11 +1,64 @@
-from celery import shared_task
+from celery import chord, shared_task
 from django.utils import timezone
-from django.core.mail import send_mail
+from django.core.mail import EmailMessage, get_connection, send_mail
 from django.conf import settings
 import logging
+import string
+
+from .cache import invalidate_dashboard_cache
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of task ids handed to a single send_task_reminders_bulk call
+REMINDER_BATCH_SIZE = 500
+
+# Maximum number of tasks deleted per query by cleanup_old_data_for_tenant
+CLEANUP_BATCH_SIZE = 5000
+
+
+# Email bodies are parsed once at import time and filled in per message
+REMINDER_EMAIL_TEMPLATE = string.Template("""
+Hi $name,
+
+This is a reminder about your task:
+
+Project: $project
+Task: $title
+Priority: $priority
+Due Date: $due_date
+
+Please complete this task at your earliest convenience.
+
+Best regards,
+Your SaaS Team
+""")
+
+WELCOME_EMAIL_TEMPLATE = string.Template("""
+Hi $name,
+
+Welcome to our platform! Your account has been successfully created.
+
+You can now start collaborating with your team, managing projects, and tracking tasks.
+
+If you have any questions, please don't hesitate to reach out to our support team.
+
+Best regards,
+The Team
+""")
+
+
+def _build_reminder_email(task):
+    """Build the subject and body of a task reminder email."""
+    subject = f'Task Reminder: {task.title}'
+    message = REMINDER_EMAIL_TEMPLATE.substitute(
+        name=task.assigned_to.get_full_name() or task.assigned_to.username,
+        project=task.project.name,
+        title=task.title,
+        priority=task.PRIORITY_DISPLAY.get(task.priority, task.priority),
+        due_date=task.due_date,
+    )
+    return subject, message
+
 
 @shared_task
 def send_task_reminder_email(task_id, tenant_schema):
@@ -13,7 +66,6 @@ def send_task_reminder_email(task_id, tenant_schema):
     Send reminder email for a task.
     Must handle tenant context for multi-tenancy.
     """
-    from django.db import connection
     from django_tenants.utils import schema_context
     from .models import Task
 
@@ -22,22 +74,7 @@ def send_task_reminder_email(task_id, tenant_schema):
             task = Task.objects.select_related('assigned_to', 'project').get(id=task_id)
 
             if task.assigned_to and task.assigned_to.email:
-                subject = f'Task Reminder: {task.title}'
-                message = f"""
-                Hi {task.assigned_to.get_full_name() or task.assigned_to.username},
-
-                This is a reminder about your task:
-
-                Project: {task.project.name}
-                Task: {task.title}
-                Priority: {task.get_priority_display()}
-                Due Date: {task.due_date}
-
-                Please complete this task at your earliest convenience.
-
-                Best regards,
-                Your SaaS Team
-                """
+                subject, message = _build_reminder_email(task)
 
                 send_mail(
                     subject,
@@ -56,43 +93,125 @@ def send_task_reminder_email(task_id, tenant_schema):
 
 
 @shared_task
-def check_overdue_tasks():
+def send_task_reminders_bulk(task_ids, tenant_schema):
     """
-    Check for overdue tasks across all tenants and send notifications.
-    This is a periodic task that runs via Celery Beat.
+    Send reminder emails for a batch of tasks in one tenant.
+    Loads all tasks in a single query instead of one per task.
     """
-    from tenants.models import Company
     from django_tenants.utils import schema_context
     from .models import Task
 
-    now = timezone.now()
-    total_overdue = 0
+    messages = []
 
-    # Iterate through all active tenants
-    for tenant in Company.objects.filter(is_active=True):
-        try:
-            with schema_context(tenant.schema_name):
-                # Find overdue tasks that are not completed
-                overdue_tasks = Task.objects.filter(
-                    due_date__lt=now,
-                    status__in=['todo', 'in_progress', 'review']
-                ).select_related('assigned_to', 'project')
+    try:
+        with schema_context(tenant_schema):
+            tasks = Task.objects.select_related('assigned_to', 'project').filter(id__in=task_ids)
+
+            for task in tasks:
+                if task.assigned_to and task.assigned_to.email:
+                    subject, message = _build_reminder_email(task)
+                    messages.append(EmailMessage(
+                        subject,
+                        message,
+                        settings.DEFAULT_FROM_EMAIL,
+                        [task.assigned_to.email],
+                    ))
+
+        # Reuse one mail server connection for the batch, but send each
+        # message on its own so one failure doesn't drop the rest
+        sent = 0
+        if messages:
+            with get_connection(fail_silently=False) as connection:
+                for email in messages:
+                    try:
+                        sent += connection.send_messages([email]) or 0
+                    except Exception as e:
+                        logger.error(
+                            f"Error sending reminder to {email.to[0]} in tenant {tenant_schema}: {str(e)}"
+                        )
+
+        logger.info(f"Sent {sent} of {len(messages)} reminder emails in tenant {tenant_schema}")
+        return f"Sent {sent} reminder emails"
 
-                for task in overdue_tasks:
-                    total_overdue += 1
+    except Exception as e:
+        logger.error(f"Error sending bulk reminders in tenant {tenant_schema}: {str(e)}")
+        raise
 
-                    # Send reminder email asynchronously
-                    if task.assigned_to:
-                        send_task_reminder_email.delay(task.id, tenant.schema_name)
 
-                logger.info(
-                    f"Found {overdue_tasks.count()} overdue tasks in tenant {tenant.schema_name}"
-                )
+@shared_task
+def summarize_tenant_counts(counts, message):
+    """
+    Chord callback that totals the counts returned by per-tenant tasks.
+    """
+    summary = message.format(total=sum(counts))
+    logger.info(summary)
+    return summary
+
+
+@shared_task
+def check_overdue_tasks_for_tenant(tenant_schema, now_iso):
+    """
+    Check a single tenant for overdue tasks and queue reminder emails.
+    Returns the number of overdue tasks found.
+    """
+    from django_tenants.utils import schema_context
+    from django.utils.dateparse import parse_datetime
+    from .models import Task
+
+    now = parse_datetime(now_iso)
 
-        except Exception as e:
-            logger.error(f"Error checking overdue tasks for tenant {tenant.schema_name}: {str(e)}")
+    try:
+        with schema_context(tenant_schema):
+            # Find overdue tasks that are not completed
+            overdue_tasks = Task.objects.filter(
+                due_date__lt=now,
+                status__in=['todo', 'in_progress', 'review']
+            ).order_by().values_list('id', 'assigned_to_id')
+
+            # Stream the rows and send reminder emails asynchronously in batches
+            overdue_count = 0
+            reminder_ids = []
+            for task_id, assigned_to_id in overdue_tasks.iterator(chunk_size=1000):
+                overdue_count += 1
+                if assigned_to_id:
+                    reminder_ids.append(task_id)
+                    if len(reminder_ids) >= REMINDER_BATCH_SIZE:
+                        send_task_reminders_bulk.delay(reminder_ids, tenant_schema)
+                        reminder_ids = []
+
+            if reminder_ids:
+                send_task_reminders_bulk.delay(reminder_ids, tenant_schema)
+
+            logger.info(
+                f"Found {overdue_count} overdue tasks in tenant {tenant_schema}"
+            )
+            return overdue_count
 
-    return f"Checked all tenants. Found {total_overdue} overdue tasks."
+    except Exception as e:
+        logger.error(f"Error checking overdue tasks for tenant {tenant_schema}: {str(e)}")
+        return 0
+
+
+@shared_task
+def check_overdue_tasks():
+    """
+    Check for overdue tasks across all tenants and send notifications.
+    This is a periodic task that runs via Celery Beat.
+    Each tenant is checked by its own task so workers process them in parallel.
+    """
+    from tenants.models import Company
+
+    now_iso = timezone.now().isoformat()
+    schema_names = list(
+        Company.objects.filter(is_active=True).values_list('schema_name', flat=True)
+    )
+
+    chord(
+        check_overdue_tasks_for_tenant.s(schema_name, now_iso)
+        for schema_name in schema_names
+    )(summarize_tenant_counts.s("Checked all tenants. Found {total} overdue tasks."))
+
+    return f"Dispatched overdue task checks for {len(schema_names)} tenants."
 
 
 @shared_task
@@ -102,34 +221,45 @@ def generate_project_report(project_id, tenant_schema):
     This is an example of a long-running background task.
     """
     from django_tenants.utils import schema_context
-    from .models import Project, Task
+    from django.db.models import Count, Q
+    from .models import Project
     import time
 
     try:
         with schema_context(tenant_schema):
-            project = Project.objects.prefetch_related('tasks', 'members').get(id=project_id)
+            project = Project.objects.select_related('owner').get(id=project_id)
 
             # Simulate long-running task
             time.sleep(2)
 
-            tasks = project.tasks.all()
+            open_statuses = ['todo', 'in_progress']
+            counts = project.tasks.aggregate(
+                total=Count('id'),
+                completed=Count('id', filter=Q(status='done')),
+                pending=Count('id', filter=Q(status__in=open_statuses)),
+                overdue=Count('id', filter=Q(
+                    due_date__lt=timezone.now(),
+                    status__in=open_statuses
+                )),
+                low=Count('id', filter=Q(priority='low')),
+                medium=Count('id', filter=Q(priority='medium')),
+                high=Count('id', filter=Q(priority='high')),
+                urgent=Count('id', filter=Q(priority='urgent')),
+            )
 
             report = {
                 'project_name': project.name,
                 'owner': project.owner.username,
                 'total_members': project.members.count(),
-                'total_tasks': tasks.count(),
-                'completed_tasks': tasks.filter(status='done').count(),
-                'pending_tasks': tasks.filter(status__in=['todo', 'in_progress']).count(),
-                'overdue_tasks': tasks.filter(
-                    due_date__lt=timezone.now(),
-                    status__in=['todo', 'in_progress']
-                ).count(),
+                'total_tasks': counts['total'],
+                'completed_tasks': counts['completed'],
+                'pending_tasks': counts['pending'],
+                'overdue_tasks': counts['overdue'],
                 'tasks_by_priority': {
-                    'low': tasks.filter(priority='low').count(),
-                    'medium': tasks.filter(priority='medium').count(),
-                    'high': tasks.filter(priority='high').count(),
-                    'urgent': tasks.filter(priority='urgent').count(),
+                    'low': counts['low'],
+                    'medium': counts['medium'],
+                    'high': counts['high'],
+                    'urgent': counts['urgent'],
                 },
                 'generated_at': timezone.now().isoformat()
             }
@@ -143,39 +273,69 @@ def generate_project_report(project_id, tenant_schema):
 
 
 @shared_task
-def cleanup_old_data(days=90):
+def cleanup_old_data_for_tenant(tenant_schema, cutoff_iso):
     """
-    Clean up old completed tasks across all tenants.
-    Runs periodically to maintain database performance.
+    Delete completed tasks older than the cutoff in a single tenant.
+    Returns the number of deleted rows.
     """
-    from tenants.models import Company
     from django_tenants.utils import schema_context
+    from django.utils.dateparse import parse_datetime
     from .models import Task
-    from datetime import timedelta
 
-    cutoff_date = timezone.now() - timedelta(days=days)
-    total_deleted = 0
+    cutoff_date = parse_datetime(cutoff_iso)
+
+    try:
+        with schema_context(tenant_schema):
+            # Delete completed tasks older than cutoff date in bounded batches
+            old_tasks = Task.objects.filter(
+                status='done',
+                completed_at__lt=cutoff_date
+            ).order_by()
+
+            deleted_count = 0
+            while True:
+                ids = list(old_tasks.values_list('id', flat=True)[:CLEANUP_BATCH_SIZE])
+                if not ids:
+                    break
+                deleted, _ = Task.objects.filter(id__in=ids).delete()
+                deleted_count += deleted
+
+            if deleted_count > 0:
+                # One invalidation for the whole cleanup, not one per row
+                invalidate_dashboard_cache(tenant_schema)
+                logger.info(
+                    f"Deleted {deleted_count} old tasks from tenant {tenant_schema}"
+                )
+            return deleted_count
+
+    except Exception as e:
+        logger.error(f"Error cleaning up data for tenant {tenant_schema}: {str(e)}")
+        return 0
 
-    for tenant in Company.objects.filter(is_active=True):
-        try:
-            with schema_context(tenant.schema_name):
-                # Delete completed tasks older than cutoff date
-                deleted_count, _ = Task.objects.filter(
-                    status='done',
-                    completed_at__lt=cutoff_date
-                ).delete()
 
-                total_deleted += deleted_count
+@shared_task
+def cleanup_old_data(days=90):
+    """
+    Clean up old completed tasks across all tenants.
+    Runs periodically to maintain database performance.
+    Each tenant is cleaned by its own task so workers process them in parallel.
+    """
+    from tenants.models import Company
+    from datetime import timedelta
 
-                if deleted_count > 0:
-                    logger.info(
-                        f"Deleted {deleted_count} old tasks from tenant {tenant.schema_name}"
-                    )
+    cutoff_iso = (timezone.now() - timedelta(days=days)).isoformat()
+    schema_names = list(
+        Company.objects.filter(is_active=True).values_list('schema_name', flat=True)
+    )
 
-        except Exception as e:
-            logger.error(f"Error cleaning up data for tenant {tenant.schema_name}: {str(e)}")
+    chord(
+        cleanup_old_data_for_tenant.s(schema_name, cutoff_iso)
+        for schema_name in schema_names
+    )(summarize_tenant_counts.s(
+        "Cleanup completed. Deleted {total} old tasks across all tenants."
+    ))
 
-    return f"Cleanup completed. Deleted {total_deleted} old tasks across all tenants."
+    return f"Dispatched cleanup for {len(schema_names)} tenants."
 
 
 @shared_task
@@ -191,18 +351,9 @@ def send_welcome_email(user_id, tenant_schema):
             user = User.objects.get(id=user_id)
 
             subject = 'Welcome to Our SaaS Platform!'
-            message = f"""
-            Hi {user.get_full_name() or user.username},
-
-            Welcome to our platform! Your account has been successfully created.
-
-            You can now start collaborating with your team, managing projects, and tracking tasks.
-
-            If you have any questions, please don't hesitate to reach out to our support team.
-
-            Best regards,
-            The Team
-            """
+            message = WELCOME_EMAIL_TEMPLATE.substitute(
+                name=user.get_full_name() or user.username
+            )
 
             if user.email:
                 send_mail(
@@ -1,3 +1,61 @@
-from django.test import TestCase
+from django.contrib.auth.models import User
+from django.test import override_settings
+from django_tenants.test.cases import TenantTestCase
+from rest_framework import status
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from .models import Project
+
+
+@override_settings(CACHES={
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}
+})
+class ProjectMembershipTests(TenantTestCase):
+    """Tests for the add_member and remove_member project actions"""
+
+    @classmethod
+    def setup_tenant(cls, tenant):
+        tenant.name = 'Test Company'
+
+    def setUp(self):
+        self.owner = User.objects.create_user(username='owner', password='pass12345')
+        self.other = User.objects.create_user(username='other', password='pass12345')
+        self.project = Project.objects.create(
+            name='Test Project', owner=self.owner, start_date='2024-01-01'
+        )
+        self.client = APIClient(HTTP_HOST=self.domain.domain)
+        self.client.force_authenticate(self.owner)
+
+    def post_action(self, action, user_id):
+        return self.client.post(
+            f'/api/projects/{self.project.pk}/{action}/',
+            {'user_id': user_id},
+            format='json'
+        )
+
+    def test_add_member(self):
+        response = self.post_action('add_member', self.other.pk)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertTrue(self.project.members.filter(pk=self.other.pk).exists())
+
+    def test_add_member_unknown_user(self):
+        for user_id in (self.other.pk + 1000, 10 ** 12, 'abc', None):
+            response = self.post_action('add_member', user_id)
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertFalse(self.project.members.exists())
+
+    def test_add_member_requires_owner(self):
+        self.project.members.add(self.other)
+        self.client.force_authenticate(self.other)
+        response = self.post_action('add_member', self.other.pk)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_remove_member(self):
+        self.project.members.add(self.other)
+        response = self.post_action('remove_member', self.other.pk)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(self.project.members.exists())
+
+    def test_remove_non_member(self):
+        response = self.post_action('remove_member', self.other.pk)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -3,8 +3,10 @@ from rest_framework.decorators import action, api_view, permission_classes
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django.contrib.auth.models import User
-from django.db.models import Q
+from django.db import DataError, IntegrityError, connection
+from django.db.models import Count, F, Prefetch, Q
 
+from .cache import get_or_compute_dashboard_stats, invalidate_dashboard_cache
 from .models import UserProfile, Project, Task
 from .serializers import (
     UserSerializer, UserProfileSerializer, UserRegistrationSerializer,
@@ -15,6 +17,57 @@ from .permissions import (
 )
 
 
+def related_user_fields(lookup):
+    """Column names for the related users rendered by UserSerializer"""
+    return tuple(f'{lookup}__{field}' for field in UserSerializer.Meta.fields)
+
+
+# Columns TaskSerializer renders, plus the project owner used by permissions
+TASK_QUERYSET_FIELDS = (
+    'id', 'project', 'title', 'description', 'priority', 'status',
+    'assigned_to', 'created_by', 'due_date', 'completed_at',
+    'created_at', 'updated_at', 'project__name', 'project__owner',
+) + related_user_fields('assigned_to') + related_user_fields('created_by')
+
+
+def user_prefetch(lookup):
+    """
+    Prefetch related users, loading only the columns UserSerializer renders.
+    """
+    return Prefetch(lookup, queryset=User.objects.only(*UserSerializer.Meta.fields))
+
+
+def accessible_project_ids(user):
+    """
+    Subquery of ids for projects the user owns or is a member of.
+    Avoids the members JOIN + DISTINCT of an OR across the M2M.
+    """
+    owned_ids = Project.objects.filter(owner=user).values('id').order_by()
+    member_ids = Project.members.through.objects.filter(
+        user=user
+    ).values('project_id').order_by()
+    return owned_ids.union(member_ids)
+
+
+class DashboardCacheInvalidationMixin:
+    """
+    Invalidate the tenant's cached dashboards once per write,
+    rather than per row from model signals.
+    """
+
+    def perform_create(self, serializer):
+        super().perform_create(serializer)
+        invalidate_dashboard_cache(connection.schema_name)
+
+    def perform_update(self, serializer):
+        super().perform_update(serializer)
+        invalidate_dashboard_cache(connection.schema_name)
+
+    def perform_destroy(self, instance):
+        super().perform_destroy(instance)
+        invalidate_dashboard_cache(connection.schema_name)
+
+
 class UserViewSet(viewsets.ModelViewSet):
     """
     ViewSet for managing users within the tenant.
@@ -47,7 +100,7 @@ class UserViewSet(viewsets.ModelViewSet):
         return Response(UserProfileSerializer(profile).data)
 
 
-class ProjectViewSet(viewsets.ModelViewSet):
+class ProjectViewSet(DashboardCacheInvalidationMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing projects within the tenant.
     Users can only see projects they own or are members of.
@@ -62,8 +115,13 @@ class ProjectViewSet(viewsets.ModelViewSet):
         """
         user = self.request.user
         return Project.objects.filter(
-            Q(owner=user) | Q(members=user)
-        ).distinct().prefetch_related('members', 'tasks')
+            id__in=accessible_project_ids(user)
+        ).annotate(
+            task_count=Count('tasks')
+        ).order_by(
+            # Meta.ordering is dropped from GROUP BY queries
+            '-created_at'
+        ).prefetch_related(user_prefetch('owner'), user_prefetch('members'))
 
     def get_permissions(self):
         """
@@ -81,74 +139,104 @@ class ProjectViewSet(viewsets.ModelViewSet):
         project = self.get_object()
 
         # Only owner can add members
-        if project.owner != request.user:
+        if project.owner_id != request.user.pk:
             return Response(
                 {'error': 'Only project owner can add members'},
                 status=status.HTTP_403_FORBIDDEN
             )
 
-        user_id = request.data.get('user_id')
         try:
-            user = User.objects.get(id=user_id)
-            project.members.add(user)
+            user_id = int(request.data.get('user_id'))
+        except (TypeError, ValueError):
+            user_id = None
+
+        # Check the id without loading the user. The deferred FK check alone
+        # would only fail at the outermost commit, e.g. under ATOMIC_REQUESTS.
+        if user_id is None or not User.objects.filter(pk=user_id).exists():
             return Response(
-                ProjectSerializer(project, context={'request': request}).data
+                {'error': 'User not found'},
+                status=status.HTTP_404_NOT_FOUND
             )
-        except User.DoesNotExist:
+
+        try:
+            project.members.add(user_id)
+        except (IntegrityError, DataError):
+            # User deleted concurrently, or an id outside the column's range
             return Response(
                 {'error': 'User not found'},
                 status=status.HTTP_404_NOT_FOUND
             )
 
+        invalidate_dashboard_cache(connection.schema_name)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
     @action(detail=True, methods=['post'])
     def remove_member(self, request, pk=None):
         """Remove a member from the project"""
         project = self.get_object()
 
         # Only owner can remove members
-        if project.owner != request.user:
+        if project.owner_id != request.user.pk:
             return Response(
                 {'error': 'Only project owner can remove members'},
                 status=status.HTTP_403_FORBIDDEN
             )
 
-        user_id = request.data.get('user_id')
         try:
-            user = User.objects.get(id=user_id)
-            project.members.remove(user)
-            return Response(
-                ProjectSerializer(project, context={'request': request}).data
-            )
-        except User.DoesNotExist:
+            user_id = int(request.data.get('user_id'))
+        except (TypeError, ValueError):
+            user_id = None
+
+        # Delete the membership row directly instead of loading the user first
+        removed = 0
+        if user_id is not None:
+            removed, _ = Project.members.through.objects.filter(
+                project=project, user_id=user_id
+            ).delete()
+
+        if not removed:
             return Response(
-                {'error': 'User not found'},
+                {'error': 'User is not a project member'},
                 status=status.HTTP_404_NOT_FOUND
             )
 
+        invalidate_dashboard_cache(connection.schema_name)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
     @action(detail=True, methods=['get'])
     def statistics(self, request, pk=None):
         """Get project statistics"""
         project = self.get_object()
-        tasks = project.tasks.all()
+        counts = project.tasks.aggregate(
+            total=Count('id'),
+            todo=Count('id', filter=Q(status='todo')),
+            in_progress=Count('id', filter=Q(status='in_progress')),
+            review=Count('id', filter=Q(status='review')),
+            done=Count('id', filter=Q(status='done')),
+            low=Count('id', filter=Q(priority='low')),
+            medium=Count('id', filter=Q(priority='medium')),
+            high=Count('id', filter=Q(priority='high')),
+            urgent=Count('id', filter=Q(priority='urgent')),
+        )
 
         stats = {
-            'total_tasks': tasks.count(),
-            'todo': tasks.filter(status='todo').count(),
-            'in_progress': tasks.filter(status='in_progress').count(),
-            'review': tasks.filter(status='review').count(),
-            'done': tasks.filter(status='done').count(),
+            'total_tasks': counts['total'],
+            'todo': counts['todo'],
+            'in_progress': counts['in_progress'],
+            'review': counts['review'],
+            'done': counts['done'],
             'by_priority': {
-                'low': tasks.filter(priority='low').count(),
-                'medium': tasks.filter(priority='medium').count(),
-                'high': tasks.filter(priority='high').count(),
-                'urgent': tasks.filter(priority='urgent').count(),
+                'low': counts['low'],
+                'medium': counts['medium'],
+                'high': counts['high'],
+                'urgent': counts['urgent'],
             }
         }
 
         return Response(stats)
 
 
-class TaskViewSet(viewsets.ModelViewSet):
+class TaskViewSet(DashboardCacheInvalidationMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing tasks within the tenant.
     Users can only see tasks from projects they have access to.
@@ -163,15 +251,12 @@ class TaskViewSet(viewsets.ModelViewSet):
         """
         user = self.request.user
 
-        # Get accessible projects
-        accessible_projects = Project.objects.filter(
-            Q(owner=user) | Q(members=user)
-        )
-
         # Filter tasks by accessible projects
         queryset = Task.objects.filter(
-            project__in=accessible_projects
-        ).select_related('project', 'assigned_to', 'created_by')
+            project_id__in=accessible_project_ids(user)
+        ).select_related(
+            'project', 'assigned_to', 'created_by'
+        ).only(*TASK_QUERYSET_FIELDS)
 
         # Filter by query parameters
         project_id = self.request.query_params.get('project', None)
@@ -208,6 +293,7 @@ class TaskViewSet(viewsets.ModelViewSet):
         task.status = 'done'
         task.completed_at = timezone.now()
         task.save()
+        invalidate_dashboard_cache(connection.schema_name)
 
         return Response(TaskSerializer(task, context={'request': request}).data)
 
@@ -219,42 +305,56 @@ class TaskViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-@api_view(['GET'])
-@permission_classes([IsAuthenticated])
-def dashboard_stats(request):
-    """
-    Get dashboard statistics for the current user.
-    """
+def _compute_dashboard_stats(request):
+    """Build the dashboard statistics payload for the current user"""
     user = request.user
 
     # Get accessible projects
-    projects = Project.objects.filter(
-        Q(owner=user) | Q(members=user)
-    ).distinct()
+    project_ids = accessible_project_ids(user)
+    projects = Project.objects.filter(id__in=project_ids)
 
     # Get tasks from accessible projects
-    all_tasks = Task.objects.filter(project__in=projects)
+    all_tasks = Task.objects.filter(project_id__in=project_ids)
     my_tasks = all_tasks.filter(assigned_to=user)
 
+    my_task_counts = my_tasks.aggregate(
+        total=Count('id'),
+        todo=Count('id', filter=Q(status='todo')),
+        in_progress=Count('id', filter=Q(status='in_progress')),
+        done=Count('id', filter=Q(status='done')),
+    )
+
     stats = {
         'total_projects': projects.count(),
         'total_tasks': all_tasks.count(),
-        'my_tasks': {
-            'total': my_tasks.count(),
-            'todo': my_tasks.filter(status='todo').count(),
-            'in_progress': my_tasks.filter(status='in_progress').count(),
-            'done': my_tasks.filter(status='done').count(),
-        },
-        'projects': ProjectSerializer(
-            projects[:5],
-            many=True,
-            context={'request': request}
-        ).data,
-        'recent_tasks': TaskSerializer(
-            my_tasks.order_by('-created_at')[:5],
-            many=True,
-            context={'request': request}
-        ).data
+        'my_tasks': my_task_counts,
+        # Plain value rows: the dashboard only shows summaries, so skip
+        # the per-field cost of the full serializers
+        'projects': list(
+            projects.annotate(task_count=Count('tasks')).order_by('-created_at').values(
+                'id', 'name', 'status', 'start_date', 'end_date', 'task_count'
+            )[:5]
+        ),
+        'recent_tasks': list(
+            my_tasks.order_by('-created_at').values(
+                'id', 'project', 'title', 'priority', 'status', 'due_date',
+                project_name=F('project__name')
+            )[:5]
+        )
     }
 
-    return Response(stats)
\ No newline at end of file
+    return stats
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def dashboard_stats(request):
+    """
+    Get dashboard statistics for the current user.
+    Cached briefly per user and tenant.
+    """
+    stats = get_or_compute_dashboard_stats(
+        connection.schema_name, request.user.pk,
+        lambda: _compute_dashboard_stats(request)
+    )
+    return Response(stats)
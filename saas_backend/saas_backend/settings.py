@@ -21,6 +21,10 @@ ALLOWED_HOSTS = env.list('ALLOWED_HOSTS', default=['*'])
 TENANT_MODEL = "tenants.Company"
 TENANT_DOMAIN_MODEL = "tenants.Domain"
 
+# Only issue SET search_path when the active schema actually changes,
+# instead of before every query
+TENANT_LIMIT_SET_CALLS = True
+
 # Application definition
 SHARED_APPS = [
     'django_tenants',
@@ -117,6 +121,15 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Password hashing: Argon2 for new passwords, the others verify
+# (and upgrade on login) hashes created before the switch
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
 # Internationalization
 LANGUAGE_CODE = 'en-us'
 TIME_ZONE = 'UTC'
@@ -154,6 +167,10 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
     ),
+    'DEFAULT_RENDERER_CLASSES': (
+        'saas_backend.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20,
 }
@@ -166,6 +183,8 @@ SIMPLE_JWT = {
     'REFRESH_TOKEN_LIFETIME': timedelta(days=7),
     'ROTATE_REFRESH_TOKENS': True,
     'BLACKLIST_AFTER_ROTATION': True,
+    # Encoded once here instead of on every sign/verify
+    'SIGNING_KEY': SECRET_KEY.encode(),
 }
 
 # CORS
@@ -176,6 +195,16 @@ CORS_ALLOWED_ORIGINS = env.list('CORS_ALLOWED_ORIGINS', default=[
 
 CORS_ALLOW_CREDENTIALS = True
 
+# Cache
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        # Separate Redis DB from the Celery broker, so clearing the cache
+        # can't flush queued tasks
+        'LOCATION': env('CACHE_URL', default='redis://localhost:6379/1'),
+    }
+}
+
 # Celery Configuration
 CELERY_BROKER_URL = env('CELERY_BROKER_URL', default='redis://localhost:6379/0')
 CELERY_RESULT_BACKEND = env('CELERY_RESULT_BACKEND', default='redis://localhost:6379/0')
@@ -5,10 +5,10 @@ from .models import Company, Domain
 
 @admin.register(Company)
 class CompanyAdmin(TenantAdminMixin, admin.ModelAdmin):
-    list_display = ['name', 'schema_name', 'subscription_plan', 'is_active', 'created_at']
-    list_filter = ['subscription_plan', 'is_active', 'created_at']
-    search_fields = ['name', 'schema_name', 'contact_email']
-    readonly_fields = ['created_at', 'updated_at']
+    list_display = ('name', 'schema_name', 'subscription_plan', 'is_active', 'created_at')
+    list_filter = ('subscription_plan', 'is_active', 'created_at')
+    search_fields = ('name', 'schema_name', 'contact_email')
+    readonly_fields = ('created_at', 'updated_at')
 
     fieldsets = (
         ('Basic Information', {
@@ -31,6 +31,7 @@ class CompanyAdmin(TenantAdminMixin, admin.ModelAdmin):
 
 @admin.register(Domain)
 class DomainAdmin(admin.ModelAdmin):
-    list_display = ['domain', 'tenant', 'is_primary']
-    list_filter = ['is_primary']
-    search_fields = ['domain', 'tenant__name']
\ No newline at end of file
+    list_display = ('domain', 'tenant', 'is_primary')
+    list_select_related = ('tenant',)
+    list_filter = ('is_primary',)
+    search_fields = ('domain', 'tenant__name')
\ No newline at end of file
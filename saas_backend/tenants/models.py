@@ -12,12 +12,12 @@ class Company(TenantMixin):
     updated_at = models.DateTimeField(auto_now=True)
 
     # Subscription fields
-    SUBSCRIPTION_PLANS = [
+    SUBSCRIPTION_PLANS = (
         ('free', 'Free'),
         ('basic', 'Basic'),
         ('professional', 'Professional'),
         ('enterprise', 'Enterprise'),
-    ]
+    )
 
     subscription_plan = models.CharField(
         max_length=20,
@@ -42,6 +42,9 @@ class Company(TenantMixin):
     class Meta:
         verbose_name = 'Company'
         verbose_name_plural = 'Companies'
+        indexes = [
+            models.Index(fields=['is_active', 'subscription_plan'], name='company_active_plan_idx'),
+        ]
 
     def __str__(self):
         return self.name
@@ -1,9 +1,33 @@
+import re
+from copy import copy
 from rest_framework import serializers
+from django.db import IntegrityError, transaction
+from django_tenants.utils import tenant_context
 from .models import Company, Domain
 from django.contrib.auth.models import User
 
+SCHEMA_NAME_RE = re.compile(r'\A[a-z0-9_]+\Z')
 
-class CompanySerializer(serializers.ModelSerializer):
+# Serializer class -> fields built by get_fields(), see CachedFieldsMixin
+_FIELD_CACHE = {}
+
+
+class CachedFieldsMixin:
+    """
+    Build a serializer's fields once per class and give each instance
+    shallow copies, instead of rebuilding them on every instantiation.
+    """
+
+    def get_fields(self):
+        cls = self.__class__
+        cached = _FIELD_CACHE.get(cls)
+        if cached is None:
+            cached = super().get_fields()
+            _FIELD_CACHE[cls] = cached
+        return {name: copy(field) for name, field in cached.items()}
+
+
+class CompanySerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for Company/Tenant"""
 
     class Meta:
@@ -17,7 +41,7 @@ class CompanySerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'schema_name']
 
 
-class DomainSerializer(serializers.ModelSerializer):
+class DomainSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for Domain"""
 
     class Meta:
@@ -26,7 +50,7 @@ class DomainSerializer(serializers.ModelSerializer):
         read_only_fields = ['id']
 
 
-class CompanyRegistrationSerializer(serializers.Serializer):
+class CompanyRegistrationSerializer(CachedFieldsMixin, serializers.Serializer):
     """Serializer for registering a new company with admin user"""
 
     company_name = serializers.CharField(max_length=255)
@@ -43,56 +67,70 @@ class CompanyRegistrationSerializer(serializers.Serializer):
     )
 
     def validate_schema_name(self, value):
-        """Ensure schema name is valid and unique"""
-        if Company.objects.filter(schema_name=value).exists():
-            raise serializers.ValidationError("This schema name is already taken.")
+        """Ensure schema name is valid; uniqueness is enforced on insert"""
+        value = value.lower()
 
         # Schema name must be valid PostgreSQL identifier
-        if not value.replace('_', '').isalnum():
+        if not SCHEMA_NAME_RE.match(value):
             raise serializers.ValidationError(
                 "Schema name must contain only alphanumeric characters and underscores."
             )
 
-        return value.lower()
+        return value
 
     def validate_domain_url(self, value):
-        """Ensure domain is unique"""
+        """
+        Ensure domain is unique before any schema work is done.
+        Creating the company builds and migrates its schema, so a duplicate
+        domain must be rejected here rather than on insert.
+        """
+        value = value.lower()
         if Domain.objects.filter(domain=value).exists():
             raise serializers.ValidationError("This domain is already registered.")
-        return value.lower()
+        return value
 
     def create(self, validated_data):
         """Create company, domain, and admin user"""
-        from django.db import transaction
-        from django.contrib.auth.models import User
-
         with transaction.atomic():
-            # Create the company/tenant
-            company = Company.objects.create(
-                name=validated_data['company_name'],
-                schema_name=validated_data['schema_name'],
-                subscription_plan=validated_data['subscription_plan']
-            )
-
-            # Create the domain
-            domain = Domain.objects.create(
+            # Create the company/tenant, relying on the unique schema_name
+            # constraint rather than checking for duplicates first
+            try:
+                company = Company.objects.create(
+                    name=validated_data['company_name'],
+                    schema_name=validated_data['schema_name'],
+                    subscription_plan=validated_data['subscription_plan']
+                )
+            except IntegrityError:
+                raise serializers.ValidationError(
+                    {'schema_name': ["This schema name is already taken."]}
+                )
+
+            # Create the domain; the unique constraint catches a domain
+            # registered concurrently since validate_domain_url().
+            # bulk_create skips DomainMixin.save(), whose UPDATE demoting other
+            # primary domains is a wasted round-trip for a brand-new tenant.
+            domain = Domain(
                 domain=validated_data['domain_url'],
                 tenant=company,
                 is_primary=True
             )
-
-            # Switch to tenant schema to create admin user
-            from django.db import connection
-            connection.set_tenant(company)
-
-            # Create admin user in tenant schema
-            admin_user = User.objects.create_user(
-                username=validated_data['admin_username'],
-                email=validated_data['admin_email'],
-                password=validated_data['admin_password'],
-                is_staff=True,
-                is_superuser=True
-            )
+            try:
+                Domain.objects.bulk_create([domain])
+            except IntegrityError:
+                raise serializers.ValidationError(
+                    {'domain_url': ["This domain is already registered."]}
+                )
+
+            # Create admin user in tenant schema; the previous schema
+            # is restored afterwards
+            with tenant_context(company):
+                admin_user = User.objects.create_user(
+                    username=validated_data['admin_username'],
+                    email=validated_data['admin_email'],
+                    password=validated_data['admin_password'],
+                    is_staff=True,
+                    is_superuser=True
+                )
 
             return {
                 'company': company,
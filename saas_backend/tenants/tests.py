@@ -1,3 +1,50 @@
-from django.test import TestCase
+from django.contrib.auth.models import User
+from django_tenants.test.cases import TenantTestCase
+from rest_framework import status
+from rest_framework.test import APIRequestFactory, force_authenticate
 
-# Create your tests here.
+from .views import CompanyViewSet
+
+
+class CompanyListETagTests(TenantTestCase):
+    """Tests for conditional GETs on the company list"""
+
+    @classmethod
+    def setup_tenant(cls, tenant):
+        tenant.name = 'Test Company'
+
+    def setUp(self):
+        self.admin = User.objects.create_superuser(
+            username='admin', email='admin@example.com', password='pass12345'
+        )
+        self.factory = APIRequestFactory()
+        self.view = CompanyViewSet.as_view({'get': 'list'})
+
+    def get(self, accept='application/json', **headers):
+        request = self.factory.get('/api/companies/', HTTP_ACCEPT=accept, **headers)
+        force_authenticate(request, user=self.admin)
+        return self.view(request)
+
+    def test_list_returns_etag(self):
+        response = self.get()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response['ETag'])
+        self.assertIn('Accept', response['Vary'])
+
+    def test_matching_etag_returns_not_modified(self):
+        etag = self.get()['ETag']
+        response = self.get(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_etag_differs_per_representation(self):
+        etag = self.get()['ETag']
+        response = self.get(accept='text/html', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_changed_company_invalidates_etag(self):
+        etag = self.get()['ETag']
+        self.tenant.name = 'Renamed Company'
+        self.tenant.save()
+        response = self.get(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -1,12 +1,21 @@
+import hashlib
+
 from rest_framework import viewsets, status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny, IsAdminUser
+from django.db.models import Count, Max
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers, quote_etag
+from django.views.decorators.http import require_GET
 from .models import Company, Domain
 from .serializers import (
     CompanySerializer, DomainSerializer, CompanyRegistrationSerializer
 )
 
+# Static health check payload, encoded once at import time
+HEALTH_CHECK_BODY = b'{"status":"healthy","service":"Multi-Tenant SaaS Backend"}'
+
 
 class CompanyViewSet(viewsets.ModelViewSet):
     """
@@ -19,9 +28,39 @@ class CompanyViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """Filter companies based on permissions"""
-        if self.request.user.is_superuser:
-            return Company.objects.all()
-        return Company.objects.none()
+        if not self.request.user.is_superuser:
+            return Company.objects.none()
+
+        queryset = Company.objects.all()
+        if self.action == 'list':
+            # Only load serialized columns; writes keep full rows so that
+            # deferred fields such as updated_at are still saved
+            queryset = queryset.only(*CompanySerializer.Meta.fields)
+        return queryset
+
+    def list(self, request, *args, **kwargs):
+        """
+        List companies, answering 304 Not Modified when no company has been
+        added, changed or removed since the client's cached copy.
+        """
+        state = self.get_queryset().aggregate(
+            latest=Max('updated_at'), total=Count('id')
+        )
+        latest = state['latest'].timestamp() if state['latest'] else 0
+        # The same URL renders as JSON or HTML, and query parameters select
+        # the page, so both are part of the validator
+        validator = (
+            f"{state['total']}-{latest}-"
+            f"{request.accepted_renderer.format}-{request.get_full_path()}"
+        )
+        etag = quote_etag(hashlib.md5(validator.encode(), usedforsecurity=False).hexdigest())
+
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = super().list(request, *args, **kwargs)
+        response['ETag'] = etag
+        patch_vary_headers(response, ('Accept',))
+        return response
 
 
 class DomainViewSet(viewsets.ModelViewSet):
@@ -42,28 +81,24 @@ def register_company(request):
     Creates company, domain, and admin user.
     """
     serializer = CompanyRegistrationSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+    result = serializer.save()
 
-    if serializer.is_valid():
-        result = serializer.save()
-
-        return Response({
-            'message': 'Company registered successfully',
-            'company': {
-                'name': result['company'].name,
-                'schema_name': result['company'].schema_name,
-            },
-            'domain': result['domain'].domain,
-            'admin_username': result['admin_user'].username,
-        }, status=status.HTTP_201_CREATED)
-
-    return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+    return Response({
+        'message': 'Company registered successfully',
+        'company': {
+            'name': result['company'].name,
+            'schema_name': result['company'].schema_name,
+        },
+        'domain': result['domain'].domain,
+        'admin_username': result['admin_user'].username,
+    }, status=status.HTTP_201_CREATED)
 
 
-@api_view(['GET'])
-@permission_classes([AllowAny])
+@require_GET
 def health_check(request):
-    """Simple health check endpoint"""
-    return Response({
-        'status': 'healthy',
-        'service': 'Multi-Tenant SaaS Backend'
-    })
\ No newline at end of file
+    """
+    Simple health check endpoint.
+    A plain Django view: load balancers poll it, so skip DRF's request cycle.
+    """
+    return HttpResponse(HEALTH_CHECK_BODY, content_type='application/json')
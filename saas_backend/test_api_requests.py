@@ -6,30 +6,42 @@ Usage:
     python test_api_requests.py
 """
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
-import json
+import orjson
 
 # Base URL - adjust based on your setup
 BASE_URL = "http://localhost:8000"
 PUBLIC_URL = f"{BASE_URL}/api"  # Public schema
 TENANT_URL = f"{BASE_URL}/api"  # Tenant schema (will use different domain)
 
+# Shared session so every call reuses pooled connections
+SESSION = requests.Session()
+SESSION.headers.update({"Content-Type": "application/json"})
+
+# Keeps output from concurrent requests from interleaving
+PRINT_LOCK = threading.Lock()
+
 
 def print_response(title, response):
     """Helper to print API responses"""
-    print(f"\n{'=' * 60}")
-    print(f"{title}")
-    print(f"{'=' * 60}")
-    print(f"Status Code: {response.status_code}")
-    try:
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
-    except:
-        print(f"Response: {response.text}")
+    with PRINT_LOCK:
+        print(f"\n{'=' * 60}")
+        print(f"{title}")
+        print(f"{'=' * 60}")
+        print(f"Status Code: {response.status_code}")
+        try:
+            body = orjson.dumps(orjson.loads(response.content), option=orjson.OPT_INDENT_2)
+            print(f"Response: {body.decode()}")
+        except:
+            print(f"Response: {response.text}")
 
 
 def test_health_check():
     """Test health check endpoint"""
-    response = requests.get(f"{PUBLIC_URL}/health/")
+    response = SESSION.get(f"{PUBLIC_URL}/health/")
     print_response("Health Check", response)
     return response
 
@@ -46,7 +58,7 @@ def test_company_registration():
         "subscription_plan": "basic"
     }
 
-    response = requests.post(f"{PUBLIC_URL}/register/", json=data)
+    response = SESSION.post(f"{PUBLIC_URL}/register/", json=data)
     print_response("Company Registration", response)
     return response
 
@@ -58,22 +70,21 @@ def get_auth_token(username, password):
         "password": password
     }
 
-    response = requests.post(f"{TENANT_URL}/token/", json=data)
+    response = SESSION.post(f"{TENANT_URL}/token/", json=data)
     print_response("Get Auth Token", response)
 
     if response.status_code == 200:
-        return response.json().get('access')
+        return orjson.loads(response.content).get('access')
     return None
 
 
 def create_project(token, project_data):
     """Create a new project"""
     headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
+        "Authorization": f"Bearer {token}"
     }
 
-    response = requests.post(
+    response = SESSION.post(
         f"{TENANT_URL}/projects/",
         json=project_data,
         headers=headers
@@ -88,7 +99,7 @@ def list_projects(token):
         "Authorization": f"Bearer {token}"
     }
 
-    response = requests.get(f"{TENANT_URL}/projects/", headers=headers)
+    response = SESSION.get(f"{TENANT_URL}/projects/", headers=headers)
     print_response("List Projects", response)
     return response
 
@@ -96,11 +107,10 @@ def list_projects(token):
 def create_task(token, task_data):
     """Create a new task"""
     headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
+        "Authorization": f"Bearer {token}"
     }
 
-    response = requests.post(
+    response = SESSION.post(
         f"{TENANT_URL}/tasks/",
         json=task_data,
         headers=headers
@@ -115,12 +125,11 @@ def list_tasks(token, filters=None):
         "Authorization": f"Bearer {token}"
     }
 
-    url = f"{TENANT_URL}/tasks/"
-    if filters:
-        params = "&".join([f"{k}={v}" for k, v in filters.items()])
-        url = f"{url}?{params}"
-
-    response = requests.get(url, headers=headers)
+    response = SESSION.get(
+        f"{TENANT_URL}/tasks/",
+        headers=headers,
+        params=filters or {}
+    )
     print_response("List Tasks", response)
     return response
 
@@ -131,7 +140,7 @@ def get_dashboard_stats(token):
         "Authorization": f"Bearer {token}"
     }
 
-    response = requests.get(f"{TENANT_URL}/dashboard/", headers=headers)
+    response = SESSION.get(f"{TENANT_URL}/dashboard/", headers=headers)
     print_response("Dashboard Statistics", response)
     return response
 
@@ -139,11 +148,10 @@ def get_dashboard_stats(token):
 def register_user(token, user_data):
     """Register a new user in the tenant"""
     headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
+        "Authorization": f"Bearer {token}"
     }
 
-    response = requests.post(
+    response = SESSION.post(
         f"{TENANT_URL}/users/register/",
         json=user_data,
         headers=headers
@@ -185,13 +193,10 @@ def run_tests():
 
     project_id = None
     if project_response.status_code == 201:
-        project_id = project_response.json().get('id')
+        project_id = orjson.loads(project_response.content).get('id')
         print(f"\n✅ Project created with ID: {project_id}")
 
-    # Test 5: List Projects
-    list_projects(token)
-
-    # Test 6: Create Task
+    # Test 5: Create Task
     if project_id:
         task_data = {
             "project": project_id,
@@ -203,14 +208,18 @@ def run_tests():
         }
         create_task(token, task_data)
 
-    # Test 7: List Tasks
-    list_tasks(token)
-
-    # Test 8: List My Tasks
-    list_tasks(token, {"assigned_to": "me"})
-
-    # Test 9: Dashboard Stats
-    get_dashboard_stats(token)
+    # Tests 6-9: List Projects, List Tasks, List My Tasks, Dashboard Stats
+    # These reads are independent, so run them concurrently over the
+    # session's connection pool
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(list_projects, token),
+            executor.submit(list_tasks, token),
+            executor.submit(list_tasks, token, {"assigned_to": "me"}),
+            executor.submit(get_dashboard_stats, token),
+        ]
+        for future in futures:
+            future.result()
 
     # Test 10: Register New User
     user_data = {